@@ -92,13 +92,34 @@ class VideoRAGInterface:
         
         try:
             response_text = ""
-            for token in self.video_rag.answer_question(question, streaming=True):
+            tokens, evidence = self.video_rag.answer_question(question, streaming=True, with_evidence=True)
+            for token in tokens:
                 response_text += token
                 yield response_text
             
+            evidence_text = self._format_evidence(evidence)
+            if evidence_text:
+                yield response_text + evidence_text
+            
         except Exception as e:
             yield f"🔴 Error while answering: {str(e)}"
 
+    @staticmethod
+    def _format_evidence(evidence: dict) -> str:
+        if not isinstance(evidence, dict):
+            return ""
+        
+        sections = []
+        for label, key in (("Speech", "ASR"), ("On-screen text", "OCR")):
+            value = evidence.get(key)
+            lines = [line for line in value.splitlines() if line.strip()] if isinstance(value, str) else []
+            if len(lines) > 0:
+                sections.append(f"*{label}:*\n" + "\n".join(f"> {line}" for line in lines))
+        
+        if len(sections) == 0:
+            return ""
+        return "\n\n**📎 Retrieved evidence:**\n\n" + "\n\n".join(sections)
+
 
 def create_interface():
     
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+
+_ENTRY_KEYS = ("video_key", "model_name", "question", "embedding", "answer", "evidence", "created_at", "last_accessed")
+
+
+def video_fingerprint(video_path: str, chunk_size: int = 1 << 20) -> str:
+    # Content hash, so the same video indexed from another path shares cached answers
+    sha = hashlib.sha256()
+    with open(video_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def index_fingerprint(transcriptions: list, texts: list) -> str:
+    # Re-indexing a video with new ASR/OCR output must not keep serving answers built on the old index
+    payload = json.dumps({"transcriptions": transcriptions, "texts": texts}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+
+    def __init__(
+        self,
+        cache_path: str | None = None,
+        similarity_threshold: float = 0.92,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 256
+    ):
+        if cache_path is None:
+            cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "answer_cache.json")
+
+        self.cache_path = cache_path
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self) -> list:
+        if not os.path.exists(self.cache_path):
+            return []
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] Could not read answer cache at {self.cache_path}: {e}. Starting empty.")
+            return []
+
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, list):
+            print(f"[WARNING] Unexpected answer cache format at {self.cache_path}. Starting empty.")
+            return []
+
+        return [entry for entry in entries if self._is_valid_entry(entry)]
+
+    @staticmethod
+    def _is_valid_entry(entry) -> bool:
+        # A single malformed entry would otherwise make every lookup and store fail until the file is deleted
+        if not isinstance(entry, dict) or not all(key in entry for key in _ENTRY_KEYS):
+            return False
+
+        return (
+            isinstance(entry["video_key"], str)
+            and isinstance(entry["model_name"], str)
+            and isinstance(entry["question"], str)
+            and isinstance(entry["answer"], str)
+            and isinstance(entry["evidence"], dict)
+            and isinstance(entry["embedding"], list)
+            and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in entry["embedding"])
+            and all(
+                isinstance(entry[key], (int, float)) and not isinstance(entry[key], bool)
+                for key in ("created_at", "last_accessed")
+            )
+        )
+
+    def _save(self):
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": self.entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[WARNING] Could not write answer cache to {self.cache_path}: {e}")
+
+    def _drop_expired(self, now: float):
+        self.entries = [
+            entry for entry in self.entries
+            if now - entry["created_at"] < self.ttl_seconds
+        ]
+
+    @staticmethod
+    def _normalize(embed) -> np.ndarray:
+        embed = np.asarray(embed, dtype="float32").reshape(-1)
+        return embed / (np.linalg.norm(embed) + 1e-12)
+
+    def lookup(self, video_key: str, model_name: str, question_embed: np.ndarray) -> dict | None:
+        try:
+            query = self._normalize(question_embed)
+
+            with self._lock:
+                now = time.time()
+                self._drop_expired(now)
+
+                # Embeddings from another model live in a different space, even at the same size
+                candidates = [
+                    entry for entry in self.entries
+                    if entry["video_key"] == video_key
+                    and entry["model_name"] == model_name
+                    and len(entry["embedding"]) == query.shape[0]
+                ]
+                if len(candidates) == 0:
+                    return None
+
+                embeds = np.asarray([entry["embedding"] for entry in candidates], dtype="float32")
+                similarities = embeds @ query
+                best = int(np.argmax(similarities))
+                if similarities[best] < self.similarity_threshold:
+                    return None
+
+                # Kept in memory only, persisted with the next store
+                entry = candidates[best]
+                entry["last_accessed"] = now
+
+                return {
+                    "question": entry["question"],
+                    "answer": entry["answer"],
+                    "evidence": entry["evidence"],
+                    "similarity": float(similarities[best]),
+                }
+        except Exception as e:
+            print(f"[WARNING] Answer cache lookup failed: {e}")
+            return None
+
+    def store(
+        self,
+        video_key: str,
+        model_name: str,
+        question: str,
+        question_embed: np.ndarray,
+        answer: str,
+        evidence: dict
+    ):
+        try:
+            embed = self._normalize(question_embed)
+
+            with self._lock:
+                now = time.time()
+                self._drop_expired(now)
+
+                self.entries.append({
+                    "video_key": video_key,
+                    "model_name": model_name,
+                    "question": question,
+                    "embedding": embed.tolist(),
+                    "answer": answer,
+                    "evidence": evidence,
+                    "created_at": now,
+                    "last_accessed": now,
+                })
+
+                # Least recently used entries go first once the cache is full
+                if len(self.entries) > self.max_entries:
+                    self.entries.sort(key=lambda entry: entry["last_accessed"])
+                    self.entries = self.entries[-self.max_entries:]
+
+                self._save()
+        except Exception as e:
+            print(f"[WARNING] Answer cache store failed: {e}")
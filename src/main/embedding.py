@@ -5,6 +5,7 @@ import faiss
 from sentence_transformers import SentenceTransformer
 import numpy as np
 import torch
+from src.main.answer_cache import video_fingerprint
 from src.utils.video_processing import video_processing
 from src.utils.asr import transcribe
 from src.utils.ocr import ocr_frames
@@ -14,6 +15,7 @@ class EmbeddingManager:
     
     def __init__(self, video_path):
         self.video_path = video_path
+        self.video_hash = video_fingerprint(video_path)
         self.embed_model = SentenceTransformer("BAAI/bge-large-en-v1.5", device="cpu")
         
         self.frames = video_processing(video_path)
@@ -56,6 +58,7 @@ class EmbeddingManager:
 
         meta = {
             "video_path": self.video_path,
+            "video_hash": self.video_hash,
             "transcriptions": self.transcriptions,
             "texts": self.texts,
         }
@@ -7,14 +7,17 @@ import torch
 from llama_cpp import Llama
 from PIL import Image
 
+from src.main.answer_cache import AnswerCache, index_fingerprint
 from src.utils.choose_frame import choose_frame
 
 
 class VideoRAG:
     
-    def __init__(self, index_paths: dict = None):
+    def __init__(self, index_paths: dict = None, answer_cache: AnswerCache | None = None):
         self._init_from_files(index_paths)
         
+        self.answer_cache = answer_cache if answer_cache is not None else AnswerCache()
+        
         script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         model_path = os.path.join(script_dir, "gemma-3-4b-it-Q4_K_M.gguf")
         
@@ -38,6 +41,10 @@ class VideoRAG:
         self.transcriptions = meta["transcriptions"]
         self.texts = meta["texts"]
 
+        # Indexes built before video_hash existed fall back to the meta file, which outlives the upload
+        video_id = meta.get("video_hash") or "meta:" + os.path.abspath(meta_path)
+        self.video_key = video_id + ":" + index_fingerprint(self.transcriptions, self.texts)
+
         self.transcriptions_database = faiss.read_index(trans_index_path)
         self.texts_database = faiss.read_index(texts_index_path)
 
@@ -49,7 +56,8 @@ class VideoRAG:
 
         from sentence_transformers import SentenceTransformer
 
-        self.embed_model = SentenceTransformer("BAAI/bge-large-en-v1.5", device="cpu")
+        self.embed_model_name = "BAAI/bge-large-en-v1.5"
+        self.embed_model = SentenceTransformer(self.embed_model_name, device="cpu")
     
     def _rewrite_user_query(self, question):
         system_prompt_retrieve = "You are an helpful assistant, always follow my instructions. To answer the question step by step, you can provide your retrieve request to assist you by the following json format:\n"
@@ -151,9 +159,27 @@ class VideoRAG:
         
         return asr_prompt, ocr_prompt, chosen_frame
     
-    def answer_question(self, question, streaming=False):
+    def answer_question(self, question, streaming=False, with_evidence=False):
         formatted_question = "Question: " + question
         
+        question_embed = self.embed_model.encode(
+            question,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        ).astype("float32")
+        
+        cached = self.answer_cache.lookup(self.video_key, self.embed_model_name, question_embed)
+        if cached is not None:
+            if streaming:
+                def cached_generator():
+                    yield cached["answer"]
+                
+                result = cached_generator()
+            else:
+                result = cached["answer"]
+            
+            return (result, cached["evidence"]) if with_evidence else result
+        
         rewritten_info = self._rewrite_user_query(formatted_question)
         
         asr_prompt, ocr_prompt, chosen_frame = self._retrieval_information(rewritten_info)
@@ -187,6 +213,8 @@ class VideoRAG:
             }
         ]
         
+        evidence = {"ASR": asr_prompt, "OCR": ocr_prompt}
+        
         if streaming:
             response = self.llm.create_chat_completion(
                 messages=messages,
@@ -194,17 +222,29 @@ class VideoRAG:
             )
             
             def stream_generator():
+                answer = ""
                 for chunk in response:
                     if "choices" in chunk and len(chunk["choices"]) > 0:
                         delta = chunk["choices"][0].get("delta", {})
                         if "content" in delta:
+                            answer += delta["content"]
                             yield delta["content"]
+                
+                # Only fully streamed answers are cached, an interrupted stream never reaches here
+                if answer.strip():
+                    self.answer_cache.store(self.video_key, self.embed_model_name, question, question_embed, answer, evidence)
             
-            return stream_generator()
+            result = stream_generator()
         else:
             response = self.llm.create_chat_completion(
                 messages=messages,
                 stream=False
             )
             
-            return response["choices"][0]["message"]["content"] 
\ No newline at end of file
+            answer = response["choices"][0]["message"]["content"]
+            if isinstance(answer, str) and answer.strip():
+                self.answer_cache.store(self.video_key, self.embed_model_name, question, question_embed, answer, evidence)
+            
+            result = answer
+        
+        return (result, evidence) if with_evidence else result 
\ No newline at end of file
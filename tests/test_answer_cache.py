@@ -0,0 +1,189 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.main import answer_cache
+from src.main.answer_cache import AnswerCache, index_fingerprint, video_fingerprint
+
+
+MODEL = "BAAI/bge-large-en-v1.5"
+
+
+def unit(*values):
+    vector = np.asarray(values, dtype="float32")
+    return vector / np.linalg.norm(vector)
+
+
+class FakeClock:
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(answer_cache.time, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "answer_cache.json")
+
+
+def test_hit_above_threshold(cache_path, clock):
+    cache = AnswerCache(cache_path, similarity_threshold=0.9)
+    cache.store("video", MODEL, "what is physical AI?", unit(1, 0, 0), "An answer", {"ASR": "speech", "OCR": ""})
+
+    hit = cache.lookup("video", MODEL, unit(1, 0.1, 0))
+
+    assert hit["answer"] == "An answer"
+    assert hit["evidence"] == {"ASR": "speech", "OCR": ""}
+    assert hit["similarity"] >= 0.9
+
+
+def test_miss_below_threshold(cache_path, clock):
+    cache = AnswerCache(cache_path, similarity_threshold=0.9)
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+
+    assert cache.lookup("video", MODEL, unit(1, 1, 0)) is None
+
+
+def test_miss_for_other_video(cache_path, clock):
+    cache = AnswerCache(cache_path)
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+
+    assert cache.lookup("other-video", MODEL, unit(1, 0, 0)) is None
+
+
+def test_persisted_between_instances(cache_path, clock):
+    AnswerCache(cache_path).store("video", MODEL, "q", unit(0, 1, 0), "An answer", {})
+
+    assert AnswerCache(cache_path).lookup("video", MODEL, unit(0, 1, 0))["answer"] == "An answer"
+
+
+def test_expires_after_ttl(cache_path, clock):
+    cache = AnswerCache(cache_path, ttl_seconds=60)
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+
+    clock.now += 59
+    assert cache.lookup("video", MODEL, unit(1, 0, 0)) is not None
+
+    clock.now += 1
+    assert cache.lookup("video", MODEL, unit(1, 0, 0)) is None
+
+
+def test_evicts_least_recently_used(cache_path, clock):
+    cache = AnswerCache(cache_path, max_entries=2)
+    cache.store("video", MODEL, "a", unit(1, 0, 0), "A", {})
+    clock.now += 1
+    cache.store("video", MODEL, "b", unit(0, 1, 0), "B", {})
+    clock.now += 1
+    cache.lookup("video", MODEL, unit(1, 0, 0))
+    clock.now += 1
+    cache.store("video", MODEL, "c", unit(0, 0, 1), "C", {})
+
+    assert [entry["question"] for entry in cache.entries] == ["a", "c"]
+    assert cache.lookup("video", MODEL, unit(0, 1, 0)) is None
+
+
+def test_hit_does_not_rewrite_file(cache_path, clock):
+    cache = AnswerCache(cache_path)
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+    with open(cache_path, "r", encoding="utf-8") as f:
+        before = f.read()
+
+    clock.now += 5
+    cache.lookup("video", MODEL, unit(1, 0, 0))
+
+    with open(cache_path, "r", encoding="utf-8") as f:
+        assert f.read() == before
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]", '{"entries": {}}', '{"entries": [1, {"answer": "x"}]}'])
+def test_recovers_from_corrupt_file(cache_path, clock, content):
+    with open(cache_path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+    cache = AnswerCache(cache_path)
+    assert cache.entries == []
+    assert cache.lookup("video", MODEL, unit(1, 0, 0)) is None
+
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+    with open(cache_path, "r", encoding="utf-8") as f:
+        assert len(json.load(f)["entries"]) == 1
+
+
+def test_miss_for_other_embedding_model(cache_path, clock):
+    cache = AnswerCache(cache_path)
+    cache.store("video", "other-model", "q", unit(1, 0, 0), "An answer", {})
+
+    assert cache.lookup("video", MODEL, unit(1, 0, 0)) is None
+    assert cache.lookup("video", "other-model", unit(1, 0, 0))["answer"] == "An answer"
+
+
+def test_skips_entries_with_other_embedding_size(cache_path, clock):
+    cache = AnswerCache(cache_path)
+    cache.store("video", MODEL, "old model", unit(1, 0), "Old answer", {})
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+
+    assert cache.lookup("video", MODEL, unit(1, 0, 0))["answer"] == "An answer"
+    assert cache.lookup("video", MODEL, unit(1, 0, 0, 0)) is None
+
+
+def test_store_failure_is_not_raised(tmp_path, clock):
+    cache = AnswerCache(str(tmp_path / "missing" / "answer_cache.json"))
+
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+
+    assert cache.lookup("video", MODEL, unit(1, 0, 0))["answer"] == "An answer"
+
+
+@pytest.mark.parametrize("field, value", [
+    ("created_at", "2026"),
+    ("last_accessed", None),
+    ("video_key", 1),
+    ("model_name", None),
+    ("question", None),
+    ("evidence", None),
+    ("embedding", ["a", "b", "c"]),
+])
+def test_drops_entries_with_wrong_field_types(cache_path, clock, field, value):
+    cache = AnswerCache(cache_path)
+    cache.store("video", MODEL, "q", unit(1, 0, 0), "An answer", {})
+    cache.store("video", MODEL, "q2", unit(0, 1, 0), "Other answer", {})
+    with open(cache_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data["entries"][0][field] = value
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    cache = AnswerCache(cache_path)
+
+    assert [entry["question"] for entry in cache.entries] == ["q2"]
+    assert cache.lookup("video", MODEL, unit(0, 1, 0))["answer"] == "Other answer"
+
+
+def test_index_fingerprint_changes_with_index_content():
+    fingerprint = index_fingerprint(["hello"], ["PHYSICAL AI"])
+
+    assert fingerprint == index_fingerprint(["hello"], ["PHYSICAL AI"])
+    assert fingerprint != index_fingerprint(["hello there"], ["PHYSICAL AI"])
+    assert fingerprint != index_fingerprint(["hello"], [])
+
+
+def test_video_fingerprint_follows_content_not_path(tmp_path):
+    first = tmp_path / "first.mp4"
+    copy = tmp_path / "copy.mp4"
+    other = tmp_path / "other.mp4"
+    first.write_bytes(b"frame data" * 1000)
+    copy.write_bytes(b"frame data" * 1000)
+    other.write_bytes(b"other data" * 1000)
+
+    assert video_fingerprint(str(first), chunk_size=64) == video_fingerprint(str(copy))
+    assert video_fingerprint(str(first)) != video_fingerprint(str(other))
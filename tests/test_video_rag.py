@@ -0,0 +1,150 @@
+import importlib
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from src.main.answer_cache import AnswerCache
+
+
+QUESTION_EMBEDS = {
+    "what is physical AI?": [1.0, 0.0, 0.0],
+    "what does the narrator say physical AI is?": [0.99, 0.1, 0.0],
+    "who is the narrator?": [0.0, 1.0, 0.0],
+}
+
+
+class StubEmbedModel:
+
+    def encode(self, text, convert_to_numpy=True, normalize_embeddings=False):
+        embed = np.asarray(QUESTION_EMBEDS[text], dtype="float32")
+        return embed / np.linalg.norm(embed)
+
+
+class StubLlm:
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+
+    def create_chat_completion(self, messages, stream=False):
+        self.calls += 1
+        if stream:
+            tokens = [] if not self.answer else self.answer.split(" ")
+            return iter(
+                {"choices": [{"delta": {"content": token if i == 0 else " " + token}}]}
+                for i, token in enumerate(tokens)
+            )
+        return {"choices": [{"message": {"content": self.answer}}]}
+
+
+@pytest.fixture
+def video_rag_module(monkeypatch):
+    # The heavy runtime dependencies are only needed once a real model is loaded
+    llama_cpp = types.ModuleType("llama_cpp")
+    llama_cpp.Llama = object
+    pil = types.ModuleType("PIL")
+    pil.Image = types.ModuleType("PIL.Image")
+    choose_frame = types.ModuleType("src.utils.choose_frame")
+    choose_frame.choose_frame = lambda frames, objects: []
+
+    monkeypatch.setitem(sys.modules, "faiss", types.ModuleType("faiss"))
+    monkeypatch.setitem(sys.modules, "torch", types.ModuleType("torch"))
+    monkeypatch.setitem(sys.modules, "llama_cpp", llama_cpp)
+    monkeypatch.setitem(sys.modules, "PIL", pil)
+    monkeypatch.setitem(sys.modules, "src.utils.choose_frame", choose_frame)
+    monkeypatch.delitem(sys.modules, "src.main.video_rag", raising=False)
+
+    yield importlib.import_module("src.main.video_rag")
+
+    sys.modules.pop("src.main.video_rag", None)
+
+
+@pytest.fixture
+def make_rag(video_rag_module, tmp_path):
+    def make(answer="Physical AI is AI that acts in the world"):
+        rag = video_rag_module.VideoRAG.__new__(video_rag_module.VideoRAG)
+        rag.video_key = "video"
+        rag.embed_model_name = "BAAI/bge-large-en-v1.5"
+        rag.embed_model = StubEmbedModel()
+        rag.llm = StubLlm(answer)
+        rag.answer_cache = AnswerCache(str(tmp_path / "answer_cache.json"))
+        rag.rewrite_calls = 0
+
+        def rewrite(question):
+            rag.rewrite_calls += 1
+            return {}
+
+        rag._rewrite_user_query = rewrite
+        rag._retrieval_information = lambda rewritten_info: ("speech about physical AI\n", "", [])
+        return rag
+
+    return make
+
+
+def test_hit_skips_rewrite_and_llm(make_rag):
+    rag = make_rag()
+    assert rag.answer_question("what is physical AI?") == "Physical AI is AI that acts in the world"
+    assert rag.llm.calls == 1 and rag.rewrite_calls == 1
+
+    tokens, evidence = rag.answer_question(
+        "what does the narrator say physical AI is?", streaming=True, with_evidence=True
+    )
+
+    assert "".join(tokens) == "Physical AI is AI that acts in the world"
+    assert evidence == {"ASR": "speech about physical AI\n", "OCR": ""}
+    assert rag.llm.calls == 1 and rag.rewrite_calls == 1
+
+
+def test_unrelated_question_misses(make_rag):
+    rag = make_rag()
+    rag.answer_question("what is physical AI?")
+
+    rag.answer_question("who is the narrator?")
+
+    assert rag.llm.calls == 2 and rag.rewrite_calls == 2
+
+
+def test_streamed_answer_stored_after_full_consumption(make_rag):
+    rag = make_rag()
+
+    tokens = rag.answer_question("what is physical AI?", streaming=True)
+    next(tokens)
+    assert rag.answer_cache.entries == []
+
+    list(tokens)
+    assert [entry["answer"] for entry in rag.answer_cache.entries] == ["Physical AI is AI that acts in the world"]
+
+
+def test_partially_consumed_stream_is_not_stored(make_rag):
+    rag = make_rag()
+
+    tokens = rag.answer_question("what is physical AI?", streaming=True)
+    next(tokens)
+    tokens.close()
+
+    assert rag.answer_cache.entries == []
+
+
+@pytest.mark.parametrize("answer", ["", "   ", None])
+def test_empty_answer_is_not_stored(make_rag, answer):
+    rag = make_rag(answer)
+
+    rag.answer_question("what is physical AI?")
+    if answer is not None:
+        list(rag.answer_question("what is physical AI?", streaming=True))
+
+    assert rag.answer_cache.entries == []
+
+
+def test_with_evidence_returns_tuple_on_miss_and_hit(make_rag):
+    rag = make_rag()
+
+    miss = rag.answer_question("what is physical AI?", with_evidence=True)
+    hit = rag.answer_question("what is physical AI?", with_evidence=True)
+
+    expected = ("Physical AI is AI that acts in the world", {"ASR": "speech about physical AI\n", "OCR": ""})
+    assert miss == expected
+    assert hit == expected
+    assert rag.llm.calls == 1